@@ -0,0 +1,47 @@
+import os
+from firebase_admin import firestore, initialize_app
+import firebase_admin
+from google.auth.credentials import AnonymousCredentials
+from google.cloud.firestore_v1.services.firestore import FirestoreClient
+
+_db = None
+
+def get_db():
+    """Return the process-wide Firestore client, initializing Firebase on first use."""
+    global _db
+    if _db is None:
+        if not firebase_admin._apps:
+            # Initialize Firebase with web config
+            config = {
+                'apiKey': os.environ.get('FIREBASE_API_KEY'),
+                'projectId': os.environ.get('FIREBASE_PROJECT_ID')
+            }
+            initialize_app(options=config)
+        db = firestore.client()
+        if os.environ.get('FIRESTORE_TRANSPORT', 'grpc').lower() == 'rest':
+            _use_rest_transport(db)
+        _db = db
+    return _db
+
+def _use_rest_transport(db):
+    """Send db's requests over HTTP/JSON instead of opening a gRPC channel.
+
+    google.cloud.firestore.Client has no transport option, so this pre-seeds
+    the GAPIC client it would otherwise build lazily over gRPC. REST has no
+    real-time listeners, but this server never registers any.
+
+    The endpoint comes from db._target so FIRESTORE_EMULATOR_HOST and custom
+    endpoints are honoured; the emulator is plain HTTP and unauthenticated.
+    """
+    if db._emulator_host is not None:
+        endpoint = f'http://{db._emulator_host}'
+        creds = AnonymousCredentials()
+    else:
+        endpoint = db._target
+        creds = db._credentials
+    db._firestore_api_internal = FirestoreClient(
+        credentials=creds,
+        transport='rest',
+        client_options={'api_endpoint': endpoint},
+        client_info=db._client_info,
+    )
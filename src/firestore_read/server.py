@@ -1,76 +1,504 @@
 import asyncio
-import json
-from firebase_admin import credentials, firestore, initialize_app
-import firebase_admin
+import base64
+import concurrent.futures
+import orjson
+import os
+import sys
+import time
+from pathlib import Path
+from cachetools import TTLCache
+from google.cloud.firestore_v1 import FieldFilter
+from google.cloud.firestore_v1._helpers import DatetimeWithNanoseconds, GeoPoint
+from google.cloud.firestore_v1.document import DocumentReference
 from mcp.server.models import InitializationOptions
 import mcp.types as types
 from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
-import os
+from ._client import get_db
+
+# Create single server instance
+server = Server("firestore-read")
+
+# Firestore calls are blocking; run them here so the event loop stays free
+_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=32)
 
-# Initialize Firebase with web config
-config = {
-    'apiKey': os.environ.get('FIREBASE_API_KEY'),
-    'projectId': os.environ.get('FIREBASE_PROJECT_ID')
+# Upper bound on how long startup waits for the warm-up request
+_WARMUP_TIMEOUT = 3
+
+# Operators accepted in query-collection where filters, mapped to the
+# spelling the Python SDK expects
+_OPS = {
+    "==": "==", "!=": "!=", "<": "<", "<=": "<=", ">": ">", ">=": ">=",
+    "in": "in", "not-in": "not-in",
+    "array-contains": "array_contains", "array_contains": "array_contains",
+    "array-contains-any": "array_contains_any",
+    "array_contains_any": "array_contains_any",
 }
 
-try:
-    app = initialize_app(options=config)
-    db = firestore.client()
-    print("Firebase initialized successfully!")
-except Exception as e:
-    print(f"Error initializing Firebase: {str(e)}")
-    db = None
+# Firestore caps a write batch at 500 operations
+_BATCH_SIZE = 500
 
-# Create single server instance
-server = Server("firestore-read")
+# Page size bounds for get-collection and query-collection
+_DEFAULT_LIMIT = 500
+_MAX_LIMIT = 1000
 
-class FirestoreEncoder(json.JSONEncoder):
-    def default(self, obj):
-        from google.cloud.firestore_v1._helpers import DatetimeWithNanoseconds
-        
-        if isinstance(obj, DatetimeWithNanoseconds):
-            return obj.isoformat()
-        elif hasattr(obj, 'path'):
-            return str(obj.path)
-        return super().default(obj)
+# Most documents a single stream_all call returns; past this the response
+# carries a next_cursor like a normal page
+_MAX_STREAM_DOCS = 5000
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """List available Firestore tools."""
-    return [
-        types.Tool(
-            name="list-collections",
-            description="List all collections in the database",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            },
-        ),
-        types.Tool(
-            name="get-collection",
-            description="Get all documents from a collection",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "collection": {"type": "string"}
+# TextContent can't take pre-encoded bytes yet; when it grows a raw_bytes
+# field, responses (and the cache) keep the bytes instead of decoding to str
+_TEXT_ACCEPTS_BYTES = "raw_bytes" in types.TextContent.model_fields
+
+# Serialized responses of read-only tools, keyed by _cache_key()
+_CACHE = TTLCache(
+    maxsize=256, ttl=int(os.environ.get("FIRESTORE_READ_CACHE_TTL", "30"))
+)
+
+# Root collection names are cached on disk this long (seconds), so restarts
+# and other processes on the host skip the listCollectionIds call
+_COLLECTIONS_CACHE_TTL = 300
+
+# In-flight read calls, keyed by _cache_key(), so identical concurrent
+# requests await one fetch instead of each hitting Firestore
+_INFLIGHT: dict[tuple, asyncio.Future] = {}
+
+# Write generation per collection, bumped by create-document. Reads that
+# started before a write finish with stale data, so they are only cached if
+# the generation is unchanged. The collection listing has no collection
+# argument and is tracked under None.
+_GENERATIONS: dict[str | None, int] = {}
+
+# Tools that modify data and are never cached or deduplicated
+_WRITE_TOOLS = frozenset({"create-document"})
+
+def _cache_key(name, arguments):
+    arguments = arguments or {}
+    return (
+        name,
+        arguments.get("collection"),
+        orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS),
+    )
+
+def _generation(key):
+    return _GENERATIONS.get(key[1], 0)
+
+def _clear_inflight(key, task):
+    # A write may already have replaced this entry with a newer fetch
+    if _INFLIGHT.get(key) is task:
+        del _INFLIGHT[key]
+
+def _invalidate_collection(collection):
+    """Drop cached and in-flight reads of a collection, plus the collection listing."""
+    for name in (collection, None):
+        _GENERATIONS[name] = _GENERATIONS.get(name, 0) + 1
+    for key in list(_CACHE.keys()):
+        if key[1] == collection or key[0] == "list-collections":
+            _CACHE.pop(key, None)
+    # Later callers start a fresh fetch instead of joining a pre-write one
+    for key in list(_INFLIGHT.keys()):
+        if key[1] == collection or key[0] == "list-collections":
+            _INFLIGHT.pop(key, None)
+
+# Encoders for Firestore types orjson can't serialize natively, by type.
+# orjson only handles exact datetime instances, so Firestore timestamps
+# (a datetime subclass) still need an entry.
+_ENCODERS = {
+    DatetimeWithNanoseconds: lambda o: o.isoformat(),
+    DocumentReference: lambda o: o.path,
+    GeoPoint: lambda o: {"lat": o.latitude, "lng": o.longitude},
+    bytes: lambda o: base64.b64encode(o).decode(),
+}
+
+def _collections_cache_path(project):
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    return cache_home / "firestore_read" / f"collections-{project}.json"
+
+def _load_collections_cache(project, max_age=_COLLECTIONS_CACHE_TTL):
+    """Return cached collection names for project, or None if missing or stale."""
+    path = _collections_cache_path(project)
+    try:
+        if time.time() - path.stat().st_mtime >= max_age:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def _save_collections_cache(project, names):
+    path = _collections_cache_path(project)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(orjson.dumps(names))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+def _forget_collection(project, collection):
+    """Blocking drop of the on-disk collection list if collection's root isn't in it."""
+    # A subcollection path like "a/b/c" lives under root collection "a"
+    root = collection.split("/", 1)[0]
+    names = _load_collections_cache(project, max_age=float("inf"))
+    if names is not None and root not in names:
+        try:
+            _collections_cache_path(project).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+def _collection_names(db):
+    """Blocking lookup of root collection names, via the on-disk cache."""
+    names = _load_collections_cache(db.project)
+    if names is None:
+        names = [col.id for col in db.collections()]
+        _save_collections_cache(db.project, names)
+    return names
+
+def _firestore_default(obj):
+    """orjson fallback for Firestore types it can't serialize natively."""
+    for t in type(obj).__mro__:
+        encoder = _ENCODERS.get(t)
+        if encoder is not None:
+            return encoder(obj)
+    raise TypeError
+
+def _dumps(obj, compact=True):
+    option = orjson.OPT_NAIVE_UTC
+    if not compact:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=_firestore_default, option=option)
+
+def _encode_docs(rows, compact=True):
+    """Lazily encode document rows as individual JSON documents."""
+    return (_dumps(row, compact) for row in rows)
+
+def _iter_array(encoded_docs, compact=True):
+    """Join encoded documents into a JSON array."""
+    separator = b"," if compact else b",\n"
+    yield b"["
+    first = True
+    for doc in encoded_docs:
+        yield doc if first else separator + doc
+        first = False
+    yield b"]"
+
+def _iter_page(encoded_docs, next_cursor, compact=True):
+    """Join encoded documents into a page with the cursor to resume after it."""
+    yield b'{"documents":'
+    yield from _iter_array(encoded_docs, compact=compact)
+    yield b',"next_cursor":'
+    yield _dumps(next_cursor)
+    yield b"}"
+
+def _where_errors(where_filters):
+    """Return a message describing malformed filters, or None if all are valid."""
+    malformed = [f for f in where_filters if not isinstance(f, list) or len(f) != 3]
+    if malformed:
+        return f"Malformed filters, expected [field, op, value]: {malformed}"
+    bad = [op for _, op, _ in where_filters if op not in _OPS]
+    if bad:
+        return f"Invalid operators: {bad}"
+    return None
+
+def _apply_where(query, where_filters):
+    for field, op, value in where_filters:
+        query = query.where(filter=FieldFilter(field, _OPS[op], value))
+    return query
+
+def _count(query):
+    """Blocking count() aggregation; one read instead of streaming every doc."""
+    result = query.count().get()
+    return result[0][0].value
+
+def _chunks(seq, n):
+    """Split seq into consecutive lists of at most n items."""
+    return [seq[i:i + n] for i in range(0, len(seq), n)]
+
+def _write_documents(db, collection, documents):
+    """Blocking write of documents as new docs, in batches; returns their IDs.
+
+    Batches are only atomic individually, so if one fails after others have
+    committed, the error names the IDs already written so a retry can skip
+    those documents.
+    """
+    ids = []
+    for chunk in _chunks(documents, _BATCH_SIZE):
+        batch = db.batch()
+        refs = [db.collection(collection).document() for _ in chunk]
+        for ref, data in zip(refs, chunk):
+            batch.set(ref, data)
+        try:
+            batch.commit()
+        except Exception as e:
+            if not ids:
+                raise
+            raise _ToolError(
+                f"Wrote {len(ids)} of {len(documents)} documents to '{collection}' "
+                f"before failing: {str(e)}. Created IDs: {_dumps(ids).decode()}"
+            ) from e
+        ids += [ref.id for ref in refs]
+    return ids
+
+def _fetch_page(query, page_size, cursor=None):
+    """Blocking fetch of one page of document rows after cursor."""
+    query = query.limit(page_size)
+    if cursor:
+        query = query.start_after({"__name__": cursor})
+    return [{"id": d.id, "data": d.to_dict()} for d in query.stream()]
+
+async def _paginated_stream(base_query, page_size, cursor=None, max_pages=None):
+    """Yield pages of document rows, fetching the next page in the background.
+
+    base_query must be ordered by __name__. While the caller processes one page
+    the following one is already in flight, so at most one fetch overlaps with
+    the consumer at any time.
+    """
+    loop = asyncio.get_running_loop()
+    next_task = loop.run_in_executor(
+        _POOL, _fetch_page, base_query, page_size, cursor
+    )
+    pages = 0
+    while next_task is not None:
+        page = await next_task
+        pages += 1
+        next_task = None
+        if len(page) == page_size and (max_pages is None or pages < max_pages):
+            next_task = loop.run_in_executor(
+                _POOL, _fetch_page, base_query, page_size, page[-1]["id"]
+            )
+        yield page
+
+# Tool schemas are static, so build them once at import
+_TOOLS_SCHEMA: list[types.Tool] = [
+    types.Tool(
+        name="list-collections",
+        description="List all collections in the database",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        },
+    ),
+    types.Tool(
+        name="get-collection",
+        description="Get a page of documents from a collection, ordered by document ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection": {"type": "string"},
+                "fields": {"type": "array", "items": {"type": "string"}},
+                "limit": {"type": "integer", "default": _DEFAULT_LIMIT, "minimum": 1, "maximum": _MAX_LIMIT},
+                "start_after": {"type": "string"},
+                "stream_all": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": f"Fetch consecutive pages, up to {_MAX_STREAM_DOCS} documents"
                 },
-                "required": ["collection"]
+                "compact": {"type": "boolean", "default": True}
             },
-        ),
-        types.Tool(
-            name="create-document",
-            description="Create a new document in an existing collection",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "collection": {"type": "string"},
-                    "document_data": {"type": "object"}
+            "required": ["collection"]
+        },
+    ),
+    types.Tool(
+        name="query-collection",
+        description="Get a page of documents from a collection that match where filters",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection": {"type": "string"},
+                "where": {
+                    "type": "array",
+                    "description": "Filters as [field, op, value] triples",
+                    "items": {"type": "array", "minItems": 3, "maxItems": 3}
                 },
-                "required": ["collection", "document_data"]
+                "fields": {"type": "array", "items": {"type": "string"}},
+                "limit": {"type": "integer", "default": _DEFAULT_LIMIT, "minimum": 1, "maximum": _MAX_LIMIT},
+                "start_after": {"type": "string"},
+                "compact": {"type": "boolean", "default": True}
             },
+            "required": ["collection"]
+        },
+    ),
+    types.Tool(
+        name="count-collection",
+        description="Count the documents in a collection, optionally matching where filters",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection": {"type": "string"},
+                "where": {
+                    "type": "array",
+                    "description": "Filters as [field, op, value] triples",
+                    "items": {"type": "array", "minItems": 3, "maxItems": 3}
+                }
+            },
+            "required": ["collection"]
+        },
+    ),
+    types.Tool(
+        name="create-document",
+        description="Create one or more new documents in an existing collection",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "collection": {"type": "string"},
+                "document_data": {"type": "object"},
+                "documents": {"type": "array", "items": {"type": "object"}}
+            },
+            "required": ["collection"]
+        },
+    )
+]
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """List available Firestore tools."""
+    return _TOOLS_SCHEMA
+
+class _ToolError(Exception):
+    """Bad arguments or a partial failure, reported as "Error: <message>"."""
+
+def _text(payload):
+    """Wrap a str, or UTF-8 encoded JSON bytes, as tool output."""
+    if isinstance(payload, bytes):
+        if _TEXT_ACCEPTS_BYTES:
+            return [types.TextContent(type="text", raw_bytes=payload)]
+        payload = payload.decode()
+    return [types.TextContent(type="text", text=payload)]
+
+def _require(arguments, name):
+    value = arguments.get(name)
+    if not value:
+        raise _ToolError(f"Missing argument: {name}")
+    return value
+
+def _checked_limit(arguments):
+    try:
+        limit = int(arguments.get("limit", _DEFAULT_LIMIT))
+    except (TypeError, ValueError):
+        raise _ToolError("limit must be an integer")
+    if limit < 1:
+        raise _ToolError("limit must be at least 1")
+    return min(limit, _MAX_LIMIT)
+
+def _checked_where(arguments):
+    where_filters = arguments.get("where") or []
+    # Reject bad filters before paying for a round trip
+    error = _where_errors(where_filters)
+    if error:
+        raise _ToolError(error)
+    return where_filters
+
+def _checked_fields(arguments):
+    fields = arguments.get("fields")
+    # select() would iterate a bare string and project each character
+    if fields is not None and (
+        not isinstance(fields, list) or not all(isinstance(f, str) for f in fields)
+    ):
+        raise _ToolError("fields must be an array of strings")
+    return fields
+
+async def _list_collections(db, arguments):
+    names = await asyncio.get_running_loop().run_in_executor(
+        _POOL, _collection_names, db
+    )
+    return _dumps([{"name": name} for name in names], compact=False)
+
+async def _get_collection(db, arguments):
+    collection = _require(arguments, "collection")
+    fields = _checked_fields(arguments)
+    limit = _checked_limit(arguments)
+    start_after = arguments.get("start_after")
+    stream_all = arguments.get("stream_all", False)
+    compact = arguments.get("compact", True)
+    query = db.collection(collection).order_by("__name__")
+    if fields:
+        # Only transfer the requested fields
+        query = query.select(fields)
+    if stream_all:
+        # Walk pages up to the cap, encoding each while the next one is fetched
+        encoded = []
+        page = []
+        max_pages = max(1, _MAX_STREAM_DOCS // limit)
+        async for page in _paginated_stream(query, limit, start_after, max_pages):
+            encoded.extend(_encode_docs(page, compact))
+        # A full final page means the cap stopped the walk, not the collection
+        next_cursor = page[-1]["id"] if len(page) == limit else None
+    else:
+        rows = await asyncio.get_running_loop().run_in_executor(
+            _POOL, _fetch_page, query, limit, start_after
+        )
+        encoded = _encode_docs(rows, compact)
+        # A short page means the collection is exhausted
+        next_cursor = rows[-1]["id"] if len(rows) == limit else None
+    return b"".join(_iter_page(encoded, next_cursor, compact=compact))
+
+async def _query_collection(db, arguments):
+    collection = _require(arguments, "collection")
+    where_filters = _checked_where(arguments)
+    fields = _checked_fields(arguments)
+    limit = _checked_limit(arguments)
+    compact = arguments.get("compact", True)
+    start_after = arguments.get("start_after")
+    loop = asyncio.get_running_loop()
+    query = _apply_where(db.collection(collection), where_filters)
+    if fields:
+        query = query.select(fields)
+    if start_after:
+        # Resume from the cursor document's snapshot so the SDK can add the
+        # orderings inequality filters imply, which a bare ID can't express
+        snapshot = await loop.run_in_executor(
+            _POOL, db.collection(collection).document(start_after).get
+        )
+        if not snapshot.exists:
+            raise _ToolError(f"start_after document not found: {start_after}")
+        query = query.start_after(snapshot)
+    rows = await loop.run_in_executor(_POOL, _fetch_page, query, limit)
+    # A short page means every match has been returned
+    next_cursor = rows[-1]["id"] if len(rows) == limit else None
+    return b"".join(_iter_page(_encode_docs(rows, compact), next_cursor, compact=compact))
+
+async def _count_collection(db, arguments):
+    collection = _require(arguments, "collection")
+    where_filters = _checked_where(arguments)
+    query = _apply_where(db.collection(collection), where_filters)
+    count = await asyncio.get_running_loop().run_in_executor(
+        _POOL, _count, query
+    )
+    return _dumps({"count": count})
+
+async def _create_document(db, arguments):
+    collection = _require(arguments, "collection")
+    documents = arguments.get("documents")
+    if documents is None:
+        document_data = arguments.get("document_data")
+        documents = [] if document_data is None else [document_data]
+    if not documents:
+        raise _ToolError("Provide document_data or documents")
+
+    # Add new documents to collection
+    try:
+        ids = await asyncio.get_running_loop().run_in_executor(
+            _POOL, _write_documents, db, collection, documents
         )
-    ]
+    finally:
+        # Earlier batches may have committed even if a later one failed
+        _invalidate_collection(collection)
+        await asyncio.get_running_loop().run_in_executor(
+            _POOL, _forget_collection, db.project, collection
+        )
+    if len(ids) == 1:
+        return f"Created new document with ID {ids[0]} in '{collection}'"
+    return f"Created {len(ids)} new documents in '{collection}' with IDs: {_dumps(ids).decode()}"
+
+# Tool name -> handler taking (db, arguments) and returning the response,
+# either text or UTF-8 encoded JSON bytes
+_HANDLERS = {
+    "list-collections": _list_collections,
+    "get-collection": _get_collection,
+    "query-collection": _query_collection,
+    "count-collection": _count_collection,
+    "create-document": _create_document,
+}
 
 @server.call_tool()
 async def handle_call_tool(
@@ -78,84 +506,86 @@ async def handle_call_tool(
     arguments: dict | None
 ) -> list[types.TextContent]:
     """Handle tool execution."""
-    if not db:
-        return [
-            types.TextContent(
-                type="text",
-                text="Error: Firebase not properly initialized"
-            )
-        ]
-
-    # Remove or modify this check for list-collections
-    if not arguments and name != "list-collections":  # <-- Add this condition
-        return [
-            types.TextContent(
-                type="text",
-                text="Error: Missing arguments"
-            )
-        ]
+    try:
+        db = get_db()
+    except Exception:
+        return _text("Error: Firebase not properly initialized")
+
+    if name not in _HANDLERS:
+        return _text(f"Error: Unknown tool: {name}")
+    arguments = arguments or {}
+    # The collection goes into the (hashable) cache key, so check it first
+    collection = arguments.get("collection")
+    if collection is not None and not isinstance(collection, str):
+        return _text("Error: collection must be a string")
+
+    # Writes must run once per call, so never cache or share them
+    if name in _WRITE_TOOLS:
+        return await _call_tool(db, name, arguments)
 
     try:
-        if name == "list-collections":
-            collections = db.collections()
-            result = [{"name": col.id} for col in collections]
-            return [
-                types.TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2)
-                )
-            ]
-
-        elif name == "get-collection":
-            collection = arguments.get("collection")
-            docs = db.collection(collection).stream()
-            result = []
-            for doc in docs:
-                result.append({
-                    "id": doc.id,
-                    "data": doc.to_dict()
-                })
-            return [
-                types.TextContent(
-                    type="text",
-                    text=json.dumps(result, indent=2, cls=FirestoreEncoder)
-                )
-            ]
-
-        elif name == "create-document":
-            collection = arguments.get("collection")
-            document_data = arguments.get("document_data")
-            
-            # Add new document to collection
-            doc_ref = db.collection(collection).document()
-            doc_ref.set(document_data)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Created new document with ID {doc_ref.id} in '{collection}'"
-                )
-            ]
-
-        else:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"Error: Unknown tool: {name}"
-                )
-            ]
+        key = _cache_key(name, arguments)
+    except TypeError as e:
+        # orjson.JSONEncodeError, e.g. an integer outside the 64-bit range
+        return _text(f"Error: invalid arguments: {e}")
+    hit = _CACHE.get(key)
+    if hit is not None:
+        return _text(hit)
 
+    # Concurrent identical reads share a single fetch
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_call_tool(db, name, arguments, key))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda t: _clear_inflight(key, t))
+    # Shield so one caller being cancelled doesn't cancel the others
+    return await asyncio.shield(task)
+
+async def _call_tool(db, name, arguments, key=None):
+    """Run a tool, caching successful results under key unless it is None."""
+    generation = _generation(key) if key is not None else None
+    try:
+        payload = await _HANDLERS[name](db, arguments)
+    except _ToolError as e:
+        return _text(f"Error: {e}")
     except Exception as e:
-        return [
-            types.TextContent(
-                type="text",
-                text=f"Error executing {name}: {str(e)}"
-            )
-        ]
+        return _text(f"Error executing {name}: {str(e)}")
+    if isinstance(payload, bytes) and not _TEXT_ACCEPTS_BYTES:
+        # Decode once here so cache hits reuse the str instead of decoding again
+        payload = payload.decode()
+    # Skip caching if a write to the collection landed mid-read
+    if key is not None and _generation(key) == generation:
+        _CACHE[key] = payload
+    return _text(payload)
+
+async def _warm_up(db):
+    """Issue a cheap request so credentials and the channel are ready before the first tool call.
+
+    This deliberately bypasses the collection-name disk cache: a cache hit
+    would send nothing and leave the connection cold.
+    """
+    start = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    try:
+        await asyncio.wait_for(
+            loop.run_in_executor(_POOL, lambda: next(iter(db.collections()), None)),
+            timeout=_WARMUP_TIMEOUT,
+        )
+    except Exception as e:
+        print(f"Firestore warm-up failed: {str(e) or type(e).__name__}", file=sys.stderr)
+        return
+    print(f"Firestore warm-up took {(time.perf_counter() - start) * 1000:.0f} ms", file=sys.stderr)
 
 async def main():
-    if not db:
-        print("Warning: Firebase not initialized. Some features may not work.")
-        
+    # stdout carries the MCP protocol, so status messages go to stderr
+    try:
+        db = get_db()
+        print("Firebase initialized successfully!", file=sys.stderr)
+        await _warm_up(db)
+    except Exception as e:
+        print(f"Error initializing Firebase: {str(e)}", file=sys.stderr)
+        print("Warning: Firebase not initialized. Some features may not work.", file=sys.stderr)
+
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,